@@ -22,6 +22,8 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 import logging
+import os
+import sys
 
 from .backoff import *
 from .events import *
@@ -41,3 +43,15 @@ __copyright__ = "Copyright 2021-present (c) Aspect1103"
 __version__ = "1.6.1"
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
+
+# Since everything Lavapy does is I/O bound asyncio (aiohttp requests, websocket
+# sends and task scheduling), opt into uvloop's libuv based event loop when it is
+# installed. Set the LAVAPY_NO_UVLOOP environment variable to keep the default
+# asyncio event loop policy
+if sys.platform != "win32" and not os.environ.get("LAVAPY_NO_UVLOOP"):
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        uvloop.install()
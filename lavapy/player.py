@@ -23,14 +23,16 @@ SOFTWARE.
 """
 from __future__ import annotations
 
-import datetime
+import asyncio
 import logging
+import sys
+import time
 from typing import TYPE_CHECKING, Any, Dict, Optional, Type, Union
 
 import discord.ext
 
 from .exceptions import FilterAlreadyExists, FilterNotApplied, InvalidSeekPosition, RepeatException
-from .pool import NodePool
+from .pool import NodePool, _dumps
 from .queue import Queue
 from .tracks import MultiTrack, PartialResource
 
@@ -43,6 +45,21 @@ __all__ = ("Player",)
 
 logger = logging.getLogger(__name__)
 
+# Interned op names so every payload build reuses the same string objects,
+# letting dict lookups and the JSON encoder take identity-based fast paths
+_opPlay = sys.intern("play")
+_opStop = sys.intern("stop")
+_opPause = sys.intern("pause")
+_opSeek = sys.intern("seek")
+_opVolume = sys.intern("volume")
+_opFilters = sys.intern("filters")
+_opVoiceUpdate = sys.intern("voiceUpdate")
+_opDestroy = sys.intern("destroy")
+
+# Multiplying by a precomputed reciprocal is marginally cheaper than dividing
+# by 1000 in the per-update state handler
+_msToS: float = 1e-3
+
 
 class Player(discord.VoiceProtocol):
     """
@@ -66,21 +83,119 @@ class Player(discord.VoiceProtocol):
     channel: discord.VoiceChannel
         A voice channel for the player to connect to.
     """
+    # discord.VoiceProtocol has no __slots__ so instances keep a __dict__, but
+    # slotting the player's own attributes still turns their lookups into
+    # descriptor loads and keeps them out of the instance dict
+    __slots__ = ("client",
+                 "channel",
+                 "_channelId",
+                 "_guild",
+                 "_guildIdStr",
+                 "_node",
+                 "_track",
+                 "_trackLengthMs",
+                 "_volume",
+                 "_filters",
+                 "_queue",
+                 "_voiceSessionId",
+                 "_voiceServerEvent",
+                 "_voiceReady",
+                 "_connected",
+                 "_paused",
+                 "_lastUpdateTime",
+                 "_lastPositionMs",
+                 "_repeat",
+                 "_pausePayload",
+                 "_voiceUpdatePayload",
+                 "_stopBytes",
+                 "_destroyBytes",
+                 "_seekPayload",
+                 "_volumePayload",
+                 "_filtersPayload",
+                 "_filterBatchDepth",
+                 "_filtersDirty",
+                 "_firstPlay")
+
     def __init__(self, client: Union[discord.Client, discord.AutoShardedClient, discord.ext.commands.Bot, discord.ext.commands.AutoShardedBot], channel: discord.VoiceChannel) -> None:
         super().__init__(client, channel)
         self.client: Union[discord.Client, discord.AutoShardedClient, discord.ext.commands.Bot, discord.ext.commands.AutoShardedBot] = client
         self.channel: discord.VoiceChannel = channel
+        # The connected channel's ID, cached so voice state updates can
+        # compare snowflakes without resolving the channel object
+        self._channelId: int = channel.id
+        # A player is bound to one guild for its lifetime even if it moves
+        # channels, so cache the guild object and its stringified ID instead
+        # of resolving channel.guild on every payload build
+        self._guild: discord.Guild = channel.guild
+        self._guildIdStr: str = str(self._guild.id)
         self._node: Optional[Node] = NodePool.balanced()
         self._track: Optional[Track] = None
+        # The current track's length in milliseconds, cached so position
+        # reads skip the track attribute chain
+        self._trackLengthMs: int = 0
         self._volume: float = 1.0
         self._filters: Dict[str, LavapyFilter] = {}
         self._queue: Queue = Queue(self)
-        self._voiceState: Dict[str, Any] = {}
+        # Voice handshake state stored as flat attributes with an int bitmask
+        # (bit 0 = sessionId seen, bit 1 = server event seen) instead of a
+        # dict, so the readiness check is a single integer compare
+        self._voiceSessionId: Optional[str] = None
+        self._voiceServerEvent: Optional[Dict[str, Any]] = None
+        self._voiceReady: int = 0
         self._connected: bool = False
         self._paused: bool = False
-        self._lastUpdateTime: Optional[datetime.datetime] = None
-        self._lastPosition: Optional[float] = None
+        self._lastUpdateTime: Optional[float] = None
+        # Positions are kept in integer milliseconds as Lavalink reports them
+        # and only converted to float seconds at the position property
+        self._lastPositionMs: int = 0
         self._repeat: bool = False
+        # Template payload mutated in place on each pause toggle instead of
+        # rebuilding a dict per call. This is safe since Node._send serialises
+        # the payload before yielding control back to the caller
+        self._pausePayload: Dict[str, Any] = {
+            "op": _opPause,
+            "guildId": self._guildIdStr,
+            "pause": False
+        }
+        self._voiceUpdatePayload: Dict[str, Any] = {
+            "op": _opVoiceUpdate,
+            "guildId": self._guildIdStr,
+            "sessionId": None,
+            "event": None
+        }
+        # stop and destroy payloads never change at all, so serialise them
+        # once and send the bytes straight to the websocket
+        self._stopBytes: bytes = _dumps({
+            "op": _opStop,
+            "guildId": self._guildIdStr
+        })
+        self._destroyBytes: bytes = _dumps({
+            "op": _opDestroy,
+            "guildId": self._guildIdStr
+        })
+        self._seekPayload: Dict[str, Any] = {
+            "op": _opSeek,
+            "guildId": self._guildIdStr,
+            "position": 0
+        }
+        self._volumePayload: Dict[str, Any] = {
+            "op": _opVolume,
+            "guildId": self._guildIdStr,
+            "volume": 0
+        }
+        # The filters op payload is maintained incrementally as filters are
+        # added and removed, so sending it is O(1) instead of rebuilding it
+        # from every applied filter
+        self._filtersPayload: Dict[str, Any] = {
+            "op": _opFilters,
+            "guildId": self._guildIdStr,
+            "volume": self._volume/100
+        }
+        self._filterBatchDepth: int = 0
+        self._filtersDirty: bool = False
+        # Whether the next play call is the player's first, so play doesn't
+        # probe the queue's position on every invocation
+        self._firstPlay: bool = True
 
     def __repr__(self) -> str:
         return f"<Lavapy Player (ChannelID={self.channel.id}) (GuildID={self.guild.id})>"
@@ -88,7 +203,7 @@ class Player(discord.VoiceProtocol):
     @property
     def guild(self) -> discord.Guild:
         """Returns the guild this player is in."""
-        return self.channel.guild
+        return self._guild
 
     @property
     def node(self) -> Optional[Node]:
@@ -118,14 +233,21 @@ class Player(discord.VoiceProtocol):
     @property
     def position(self) -> float:
         """Returns the current position of the track in seconds. If nothing is playing, this returns 0."""
-        if not self.isPlaying:
-            return 0
-
-        if self.isPaused:
-            return min(self._lastPosition, self.track.length)
-
-        timeSinceLastUpdate = (datetime.datetime.now(datetime.timezone.utc) - self._lastUpdateTime).total_seconds()
-        return min(self._lastPosition + timeSinceLastUpdate, self.track.length)
+        # Read each slot once and branch on locals; this property gets
+        # polled every render by now-playing displays so the usual property
+        # chain (isPlaying -> isConnected -> track) is worth flattening
+        if not self._connected or self._track is None:
+            return 0.0
+
+        positionMs = self._lastPositionMs
+        if self._paused:
+            # _updateState clamps against the track length, so paused reads
+            # are a plain slot load even when a UI polls this rapidly
+            return positionMs * _msToS
+
+        positionMs += int((time.monotonic() - self._lastUpdateTime) * 1000)
+        lengthMs = self._trackLengthMs
+        return (positionMs if positionMs < lengthMs else lengthMs) * _msToS
 
     @property
     def isConnected(self) -> bool:
@@ -145,7 +267,7 @@ class Player(discord.VoiceProtocol):
     @property
     def isDead(self) -> bool:
         """Returns whether the player is dead or not. A player is considered dead if it has been destroyed and removed from stored players."""
-        return self not in self.node.players
+        return self._guild.id not in self._node._players
 
     @property
     def isRepeating(self) -> bool:
@@ -161,12 +283,15 @@ class Player(discord.VoiceProtocol):
         state: Dict[str, Any]
             The raw info sent by Lavalink.
         """
-        # State updates are sent in milliseconds so need to be converted to seconds (/1000)
-        logger.debug(f"Received state update for player with guild id {self.guild.id} with data {state}")
-        state = state.get("state")
-        self._lastUpdateTime = datetime.datetime.fromtimestamp(state.get("time")/1000, datetime.timezone.utc)
+        logger.debug("Received state update for player with guild id %d with data %s", self._guild.id, state)
+        state = state["state"]
+        self._lastUpdateTime = time.monotonic()
 
-        self._lastPosition = state.get("position", 0)/1000
+        positionMs = state.get("position", 0)
+        if self._track is not None and positionMs > self._trackLengthMs:
+            # Clamp once here so position reads don't have to
+            positionMs = self._trackLengthMs
+        self._lastPositionMs = positionMs
 
     def _multitrackCheck(self, track: Union[Track, PartialResource, MultiTrack]) -> Track:
         """
@@ -219,7 +344,8 @@ class Player(discord.VoiceProtocol):
         data: Dict[str, str]
             The raw info sent by Discord about the voice channel.
         """
-        self._voiceState.update({"event": data})
+        self._voiceServerEvent = data
+        self._voiceReady |= 2
         await self._sendVoiceUpdate()
 
     async def on_voice_state_update(self, data: Dict[str, Any]) -> None:
@@ -232,17 +358,22 @@ class Player(discord.VoiceProtocol):
         data: Dict[str, Any]
             The raw info sent by Discord about the client's voice state.
         """
-        self._voiceState.update({"sessionId": data["session_id"]})
+        self._voiceSessionId = data["session_id"]
+        self._voiceReady |= 1
         channelID = data["channel_id"]
         if channelID is None:
             # Disconnecting
-            self._voiceState.clear()
+            self._voiceSessionId = None
+            self._voiceServerEvent = None
+            self._voiceReady = 0
             await self.disconnect()
             return
-        channel = self.client.get_channel(channelID)
-        if channel != self.channel:
-            logger.debug(f"Moved player to channel {channel.id}")
-            self.channel = channel
+        channelID = int(channelID)
+        if channelID != self._channelId:
+            # Only resolve the channel object when the player actually moved
+            logger.debug("Moved player to channel %d", channelID)
+            self.channel = self.client.get_channel(channelID)
+            self._channelId = channelID
         await self._sendVoiceUpdate()
 
     async def _sendVoiceUpdate(self) -> None:
@@ -250,14 +381,11 @@ class Player(discord.VoiceProtocol):
 
         Sends data collected from on_voice_server_update and on_voice_state_update to Lavalink.
         """
-        if {"sessionId", "event"} == self._voiceState.keys():
-            logger.debug(f"Dispatching voice update for guild {self.guild.id}")
-            voiceUpdate = {
-                "op": "voiceUpdate",
-                "guildId": str(self.guild.id),
-                "sessionId": self._voiceState["sessionId"],
-                "event": self._voiceState["event"]
-            }
+        if self._voiceReady == 3:
+            logger.debug("Dispatching voice update for guild %s", self._guildIdStr)
+            voiceUpdate = self._voiceUpdatePayload
+            voiceUpdate["sessionId"] = self._voiceSessionId
+            voiceUpdate["event"] = self._voiceServerEvent
             await self.node._send(voiceUpdate)
 
     async def connect(self, *, timeout: float, reconnect: bool, selfDeaf: bool = False, selfMute: bool = False) -> None:
@@ -276,10 +404,16 @@ class Player(discord.VoiceProtocol):
         selfMute: bool
             Whether the player should connect muted or not.
         """
+        if self._connected:
+            voice = self.guild.me.voice
+            if voice is not None and voice.channel is not None and voice.channel.id == self._channelId:
+                # Already connected to the target channel; a redundant voice
+                # state change would just eat into Discord's rate limit
+                return
         await self.guild.change_voice_state(channel=self.channel, self_mute=selfMute, self_deaf=selfDeaf)
-        self.node.players.append(self)
+        self.node._players[self.guild.id] = self
         self._connected = True
-        logger.info(f"Connected to voice channel {self.channel.id}")
+        logger.info("Connected to voice channel %d", self.channel.id)
 
     async def disconnect(self, *, force: bool = False) -> None:
         """|coro|
@@ -289,13 +423,18 @@ class Player(discord.VoiceProtocol):
         Parameters
         ----------
         force: bool
-            Whether to force the disconnection. This is currently not used.
+            Whether to force the disconnection. A forced disconnect skips the
+            gateway voice state change and just cleans up local state, which
+            is what you want when the gateway connection is already gone.
         """
-        await self.guild.change_voice_state(channel=None)
+        if not self._connected and not force:
+            return
+        if not force:
+            await self.guild.change_voice_state(channel=None)
         self._connected = False
         self.cleanup()
-        self.node.players.remove(self)
-        logger.info(f"Disconnected from voice channel {self.channel.id}")
+        self._node._players.pop(self._guild.id, None)
+        logger.info("Disconnected from voice channel %d", self.channel.id)
 
     async def play(self, track: Union[Track, PartialResource, MultiTrack], startTime: int = 0, endTime: int = 0, volume: float = 1, replace: bool = True, pause: bool = False) -> Optional[Track]:
         """|coro|
@@ -335,27 +474,39 @@ class Player(discord.VoiceProtocol):
             if isinstance(track, list):
                 track = track[0]
             track = self._multitrackCheck(track)
-        if not (0 <= volume <= 5):
+        if volume < 0 or volume > 5:
             raise ValueError("Volume must be a value between 0 and 5.")
-        newTrack = {
-            "op": "play",
-            "guildId": str(self.guild.id),
-            "track": track.id,
-            "startTime": str(startTime),
-            "volume": str(volume),
-            "noReplace": not replace,
-            "pause": pause
-        }
+        # The keyword-constructor form compiles to a single call with a
+        # constant keyword tuple, sized right in one allocation
+        newTrack = dict(op=_opPlay,
+                        guildId=self._guildIdStr,
+                        track=track.id,
+                        startTime=startTime,
+                        volume=volume,
+                        noReplace=not replace,
+                        pause=pause)
         if endTime > 0:
-            newTrack["endTime"] = str(endTime)
+            newTrack["endTime"] = endTime
         self._track = track
+        # Lavalink reports track length in milliseconds already
+        self._trackLengthMs = track.length
         self._volume = volume
+        # Keep the local pause state in sync with the play op so the no-op
+        # guard in _togglePause doesn't swallow a resume after a paused start
+        self._paused = pause
+        # Seed the position clock so reads between now and the first
+        # playerUpdate from Lavalink extrapolate from the start time instead
+        # of tripping over a None timestamp
+        self._lastUpdateTime = time.monotonic()
+        self._lastPositionMs = startTime
+        self._filtersPayload["volume"] = volume/100
         await self.node._send(newTrack)
-        if self.queue.currentTrack == -1:
+        if self._firstPlay:
             # First time a new song is playing
+            self._firstPlay = False
             self.queue.tracks.insert(0, track)
             self.queue._currentTrack += 1
-        logger.debug(f"Started playing track {self.track.title} in {self.channel.id}")
+        logger.debug("Started playing track %s in %d", track.title, self.channel.id)
         return track
 
     async def stop(self) -> None:
@@ -363,14 +514,11 @@ class Player(discord.VoiceProtocol):
 
         Stops the currently playing :class:`Track`.
         """
-        stop = {
-            "op": "stop",
-            "guildId": str(self.guild.id)
-        }
         tempTrack = self.track
         self._track = None
-        await self.node._send(stop)
-        logger.debug(f"Stopped playing track {tempTrack.title} in {self.channel.id}")
+        self._trackLengthMs = 0
+        await self.node._sendRaw(self._stopBytes)
+        logger.debug("Stopped playing track %s in %d", tempTrack.title, self.channel.id)
 
     async def pause(self) -> None:
         """|coro|
@@ -378,7 +526,7 @@ class Player(discord.VoiceProtocol):
         Pauses the :class:`Player` if it was playing.
         """
         await self._togglePause(True)
-        logger.debug(f"Paused track in {self.channel.id}")
+        logger.debug("Paused track in %d", self.channel.id)
 
     async def resume(self) -> None:
         """|coro|
@@ -386,7 +534,7 @@ class Player(discord.VoiceProtocol):
         Resumes the :class:`Player` if it was paused.
         """
         await self._togglePause(False)
-        logger.debug(f"Resumed track in {self.channel.id}")
+        logger.debug("Resumed track in %d", self.channel.id)
 
     async def _togglePause(self, pause: bool) -> None:
         """|coro|
@@ -398,13 +546,11 @@ class Player(discord.VoiceProtocol):
         pause: bool
             A bool stating whether the player's paused state should be True or False.
         """
-        pause = {
-            "op": "pause",
-            "guildId": str(self.guild.id),
-            "pause": str(pause)
-        }
+        if self._paused == pause:
+            return
+        self._pausePayload["pause"] = pause
         self._paused = pause
-        await self.node._send(pause)
+        await self.node._send(self._pausePayload)
 
     async def seek(self, position: int) -> None:
         """|coro|
@@ -423,13 +569,9 @@ class Player(discord.VoiceProtocol):
         """
         if position > self.track.length:
             raise InvalidSeekPosition("Seek position is bigger than track length.")
-        seek = {
-            "op": "seek",
-            "guildId": str(self.guild.id),
-            "position": position
-        }
-        await self.node._send(seek)
-        logger.debug(f"Seeked to position {position} for guild {self.guild.id}")
+        self._seekPayload["position"] = position
+        await self.node._send(self._seekPayload)
+        logger.debug("Seeked to position %d for guild %s", position, self._guildIdStr)
 
     async def setVolume(self, volume: float) -> None:
         """|coro|
@@ -441,16 +583,15 @@ class Player(discord.VoiceProtocol):
         volume: float
             The new volume. This should be a value between 0 and 5 where 1 is 100%.
         """
-        if not (0 <= volume <= 5):
+        if volume < 0 or volume > 5:
             raise ValueError("Volume must be a value between 0 and 5.")
+        if volume == self._volume:
+            return
         self._volume = volume
-        volume = {
-            "op": "volume",
-            "guildId": str(self.guild.id),
-            "volume": str(self.volume)
-        }
-        await self.node._send(volume)
-        logger.debug(f"Set volume to {volume} for guild {self.guild.id}")
+        self._filtersPayload["volume"] = volume/100
+        self._volumePayload["volume"] = volume
+        await self.node._send(self._volumePayload)
+        logger.debug("Set volume to %s for guild %s", self._volume, self._guildIdStr)
 
     async def moveTo(self, channel: discord.VoiceChannel) -> None:
         """|coro|
@@ -483,11 +624,12 @@ class Player(discord.VoiceProtocol):
             The specific filter is already applied.
         """
         name = filter.name
-        if filter.name in self.filters.keys():
+        if name in self._filters:
             raise FilterAlreadyExists(f"Filter <{name}> is already applied. Please remove it first.")
         self.filters[name] = filter
-        await self._updateFilters()
-        logger.debug(f"Added filter {name} with payload {filter.payload} for guild {self.guild.id}")
+        self._filtersPayload[name] = filter.payload
+        await self._applyFilters()
+        logger.debug("Added filter %s with payload %s for guild %s", name, filter.payload, self._guildIdStr)
 
     async def removeFilter(self, filter: Union[LavapyFilter, Type[LavapyFilter]]) -> None:
         """|coro|
@@ -508,25 +650,52 @@ class Player(discord.VoiceProtocol):
             The specific filter is not applied.
         """
         name = filter.name
-        if name not in self.filters.keys():
+        if name not in self._filters:
             raise FilterNotApplied(f"{name} is not applied.")
         del self.filters[name]
-        await self._updateFilters()
-        logger.debug(f"Removed filter {name} for guild {self.guild.id}")
+        del self._filtersPayload[name]
+        await self._applyFilters()
+        logger.debug("Removed filter %s for guild %s", name, self._guildIdStr)
+
+    def batchFilters(self) -> _FilterBatch:
+        """
+        Coalesces several filter changes into a single Lavalink send.
+
+        Filter mutations made inside the context manager are applied to the
+        player but only sent to Lavalink once, when the block exits.
+
+        Examples
+        --------
+        .. code-block:: python
+
+           async with player.batchFilters():
+               await player.addFilter(lavapy.Equalizer.flat())
+               await player.addFilter(lavapy.Karaoke())
+
+        Returns
+        -------
+        _FilterBatch
+            An async context manager which defers the filter send.
+        """
+        return _FilterBatch(self)
+
+    async def _applyFilters(self) -> None:
+        """|coro|
+
+        Sends the applied filters to Lavalink, unless a batch is in progress
+        in which case the send is deferred until the batch exits.
+        """
+        if self._filterBatchDepth:
+            self._filtersDirty = True
+        else:
+            await self._updateFilters()
 
     async def _updateFilters(self) -> None:
         """|coro|
 
-        Collects all applied filters and sends them to Lavalink.
+        Sends the applied filters to Lavalink.
         """
-        filterPayload = {
-            "op": "filters",
-            "guildId": str(self.guild.id),
-            "volume": self.volume/100,
-        }
-        for key, value in self.filters.items():
-            filterPayload[value.name] = value.payload
-        await self.node._send(filterPayload)
+        await self.node._send(self._filtersPayload)
 
     async def resetFilter(self, filter: Type[LavapyFilter]) -> None:
         """|coro|
@@ -547,24 +716,57 @@ class Player(discord.VoiceProtocol):
             The specific filter is not applied.
         """
         name = filter.name
-        if name not in self.filters.keys():
+        if name not in self._filters:
             raise FilterNotApplied(f"{name} is not applied.")
         if name == "equalizer":
             # noinspection PyUnresolvedReferences
             self.filters[name] = filter.flat()
         else:
             self.filters[name] = filter()
-        await self._updateFilters()
+        self._filtersPayload[name] = self.filters[name].payload
+        await self._applyFilters()
 
     async def destroy(self) -> None:
         """|coro|
 
         Disconnects and destroys the player.
         """
-        logger.debug(f"Destroying player with guild id {self.guild.id}")
-        await self.disconnect()
-        destroyPayload = {
-            "op": "destroy",
-            "guildId": str(self.guild.id)
-        }
-        await self.node._send(destroyPayload)
+        logger.debug("Destroying player with guild id %s", self._guildIdStr)
+        # Drop the player from the node first so isDead reports correctly
+        # while the teardown ops are in flight, then run the Discord voice
+        # state change and the Lavalink destroy op concurrently since neither
+        # depends on the other
+        self._node._players.pop(self._guild.id, None)
+        self._connected = False
+        await asyncio.gather(
+            self.guild.change_voice_state(channel=None),
+            self.node._sendRaw(self._destroyBytes)
+        )
+        self.cleanup()
+
+
+class _FilterBatch:
+    """
+    Async context manager returned by :meth:`Player.batchFilters()` which
+    defers filter sends until the batch exits.
+
+    Parameters
+    ----------
+    player: Player
+        The player whose filter changes should be batched.
+    """
+    __slots__ = ("_player",)
+
+    def __init__(self, player: Player) -> None:
+        self._player: Player = player
+
+    async def __aenter__(self) -> Player:
+        self._player._filterBatchDepth += 1
+        return self._player
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        player = self._player
+        player._filterBatchDepth -= 1
+        if player._filterBatchDepth == 0 and player._filtersDirty:
+            player._filtersDirty = False
+            await player._updateFilters()
@@ -23,12 +23,29 @@ SOFTWARE.
 """
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
-import random
-import string
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, Union
+import secrets
+import sys
+import time
+from collections import OrderedDict
+from operator import itemgetter
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Tuple, Type, Union
 
 import aiohttp
+from yarl import URL
+
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
 
 from .exceptions import BuildTrackError, InvalidNodeSearch, LavalinkException, LoadTrackError, NodeOccupied, NoNodesConnected
 from .ext.spotify.tracks import SpotifyBase
@@ -47,6 +64,13 @@ __all__ = ("NodePool",
 
 logger = logging.getLogger(__name__)
 
+# How many loadtracks responses to keep cached per node and how long each one
+# stays valid for. Failed loads are cached much more briefly so repeated
+# invalid queries don't hammer Lavalink but recover quickly
+_trackCacheSize: int = 512
+_trackCacheTTL: float = 300.0
+_trackCacheFailureTTL: float = 10.0
+
 
 def getRandomID() -> str:
     """
@@ -57,7 +81,53 @@ def getRandomID() -> str:
     str
         The 8 character long ID
     """
-    return "".join(random.choices(string.ascii_letters + string.digits, k=8))
+    # token_urlsafe runs in C over os.urandom and can't collide in practice,
+    # unlike the old pure Python random.choices scheme
+    return secrets.token_urlsafe(6)
+
+
+# Grabs the base64 ID and info dict out of a raw track with one C-level call
+# instead of two dict lookups per track
+_trackGetter = itemgetter("track", "info")
+
+
+def _loadFailed(cls: Type[Playable], data: Dict[str, Any]) -> None:
+    """Handles the LOAD_FAILED response from Lavalink."""
+    # LOAD_FAILED bodies can carry long error traces, so truncate the message
+    raise LoadTrackError(f"Track failed to load with data: {str(data)[:512]}.")
+
+
+def _noMatches(cls: Type[Playable], data: Dict[str, Any]) -> None:
+    """Handles the NO_MATCHES response from Lavalink."""
+    return None
+
+
+def _trackLoaded(cls: Type[Playable], data: Dict[str, Any]) -> Track:
+    """Handles the TRACK_LOADED response from Lavalink."""
+    # noinspection PyArgumentList
+    return cls(*_trackGetter(data["tracks"][0]))
+
+
+def _searchResult(cls: Type[Playable], data: Dict[str, Any]) -> List[Track]:
+    """Handles the SEARCH_RESULT response from Lavalink."""
+    # noinspection PyArgumentList
+    return [cls(*_trackGetter(element)) for element in data["tracks"]]
+
+
+def _playlistLoaded(cls: Type[Playable], data: Dict[str, Any]) -> MultiTrack:
+    """Handles the PLAYLIST_LOADED response from Lavalink."""
+    trackCls = cls._trackCls
+    # noinspection PyArgumentList
+    return cls(data["playlistInfo"]["name"], [trackCls(*_trackGetter(track)) for track in data["tracks"]])
+
+
+_loadHandlers = {
+    "LOAD_FAILED": _loadFailed,
+    "NO_MATCHES": _noMatches,
+    "TRACK_LOADED": _trackLoaded,
+    "SEARCH_RESULT": _searchResult,
+    "PLAYLIST_LOADED": _playlistLoaded
+}
 
 
 class NodePool:
@@ -65,6 +135,10 @@ class NodePool:
     Lavapy NodePool class. This holds all the :class:`Node` objects created with :meth:`createNode()`.
     """
     _nodes: Dict[str, Node] = {}
+    # Secondary indexes maintained by createNode and Node.disconnect so the
+    # region and extension selectors don't have to scan every node per call
+    _byRegion: Dict[VoiceRegion, List[Node]] = {}
+    _spotifyNodes: List[Node] = []
 
     @classmethod
     def nodes(cls) -> Dict[str, Node]:
@@ -118,19 +192,47 @@ class NodePool:
         Node
             A Lavapy node object.
         """
+        # Coroutines which can complete without blocking (already buffered
+        # websocket sends, cached lookups etc.) skip a scheduling round trip
+        # with the eager task factory available on Python 3.12+
+        loop = asyncio.get_event_loop()
+        if hasattr(asyncio, "eager_task_factory") and loop.get_task_factory() is None:
+            loop.set_task_factory(asyncio.eager_task_factory)
+
         if identifier is None:
             identifier = getRandomID()
 
-        if identifier in cls._nodes:
-            raise NodeOccupied(f"A node with the identifier <{identifier}> already exists.")
-
         if not resumeKey:
             resumeKey = getRandomID()
 
         node = Node(client, host, port, password, region, secure, heartbeat, resumeKey, spotifyClient, identifier)
-        cls._nodes[identifier] = node
-        await node.connect()
-        await node._initialiseExtensions()
+        # setdefault claims the identifier atomically. A separate membership
+        # check followed by an insert leaves a window where two concurrent
+        # createNode calls (one per shard, for example) both pass the check
+        # and one node silently overwrites the other
+        if cls._nodes.setdefault(identifier, node) is not node:
+            raise NodeOccupied(f"A node with the identifier <{identifier}> already exists.")
+        if region is not None:
+            cls._byRegion.setdefault(region, []).append(node)
+        if spotifyClient is not None:
+            cls._spotifyNodes.append(node)
+        # The websocket handshake and the Spotify token fetch are independent
+        # I/O waits, so overlap them instead of paying for both in sequence
+        try:
+            await asyncio.gather(node.connect(), node._initialiseExtensions())
+        except Exception:
+            # Unregister the half-initialised node so the selectors can't
+            # hand out a node which never connected
+            cls._nodes.pop(identifier, None)
+            if region is not None:
+                regionNodes = cls._byRegion.get(region)
+                if regionNodes is not None and node in regionNodes:
+                    regionNodes.remove(node)
+            if spotifyClient is not None and node in cls._spotifyNodes:
+                cls._spotifyNodes.remove(node)
+            if node._session is not None:
+                await node._session.close()
+            raise
         return node
 
     @classmethod
@@ -142,8 +244,6 @@ class NodePool:
         ------
         NoNodesConnected
             There are currently no nodes connected with the provided options.
-        InvalidNodeSearch
-            No nodes could be found with the current algorithm.
 
         Returns
         -------
@@ -152,11 +252,7 @@ class NodePool:
         """
         if not cls._nodes:
             raise NoNodesConnected("There are currently no nodes connected.")
-        result = sorted(cls._nodes.values(), key=lambda x: len(x.players))
-        try:
-            return result[0]
-        except KeyError:
-            raise InvalidNodeSearch("No nodes could be found using the minPlayers algorithm.")
+        return min(cls._nodes.values(), key=lambda x: len(x._players))
 
     @classmethod
     def balanced(cls) -> Node:
@@ -167,8 +263,6 @@ class NodePool:
         ------
         NoNodesConnected
             There are currently no nodes connected with the provided options.
-        InvalidNodeSearch
-            No nodes could be found with the current algorithm.
 
         Returns
         -------
@@ -177,11 +271,7 @@ class NodePool:
         """
         if not cls._nodes:
             raise NoNodesConnected("There are currently no nodes connected.")
-        result = sorted(cls._nodes.values(), key=lambda x: x.penalty)
-        try:
-            return result[0]
-        except KeyError:
-            raise InvalidNodeSearch("No nodes could be found using the balanced algorithm.")
+        return min(cls._nodes.values(), key=lambda x: x.penalty)
 
     @classmethod
     def identifier(cls, identifier: str):
@@ -216,11 +306,13 @@ class NodePool:
         """
         if not cls._nodes:
             raise NoNodesConnected("There are currently no nodes connected.")
-        result = [node for node in cls._nodes.values() if node.region == region]
-        try:
-            return result[0]
-        except KeyError:
+        nodes = cls._byRegion.get(region)
+        if not nodes:
             raise InvalidNodeSearch(f"No nodes could be found with region {region}.")
+        # Prefer the node with the lowest measured round-trip time. Nodes with
+        # no samples yet sit at zero and win ties, which doubles as a cheap
+        # way to warm up fresh nodes
+        return min(nodes, key=lambda x: x._rttEwma)
 
     @classmethod
     def extension(cls, extension: Type[Playable]):
@@ -237,13 +329,10 @@ class NodePool:
         if not cls._nodes:
             raise NoNodesConnected("There are currently no nodes connected.")
         if issubclass(extension, SpotifyBase):
-            result = [node for node in cls._nodes.values() if node.spotifyClient is not None]
-        else:
-            result = list(cls._nodes.values())
-        try:
-            return result[0]
-        except KeyError:
-            raise InvalidNodeSearch(f"No nodes could be found with extension {extension}.")
+            if not cls._spotifyNodes:
+                raise InvalidNodeSearch(f"No nodes could be found with extension {extension}.")
+            return cls._spotifyNodes[0]
+        return next(iter(cls._nodes.values()))
 
 
 class Node:
@@ -253,9 +342,40 @@ class Node:
     .. warning::
         This class should not be created manually. Please use :meth:`NodePool.createNode()` instead.
     """
+    __slots__ = ("_client",
+                 "_host",
+                 "_port",
+                 "_password",
+                 "_region",
+                 "_secure",
+                 "_heartbeat",
+                 "_resumeKey",
+                 "_spotifyClient",
+                 "_identifier",
+                 "_players",
+                 "_stats",
+                 "_cachedPenalty",
+                 "_rttEwma",
+                 "_session",
+                 "_authHeaders",
+                 "_trackCache",
+                 "_decodeCache",
+                 "_inflight",
+                 "_sendBuffer",
+                 "_flushTask",
+                 "_websocket",
+                 "_websocketUri",
+                 "_restUri",
+                 "_restUrl",
+                 "_loadtracksUrl",
+                 "_decodetracksUrl")
+
     def __init__(self, client: Union[discord.Client, discord.AutoShardedClient, discord.ext.commands.Bot, discord.ext.commands.AutoShardedBot], host: str, port: int, password: str, region: Optional[discord.VoiceRegion], secure: bool, heartbeat: int, resumeKey: str, spotifyClient: Optional[SpotifyClient], identifier: str) -> None:
         self._client: Union[discord.Client, discord.AutoShardedClient, discord.ext.commands.Bot, discord.ext.commands.AutoShardedBot] = client
-        self._host: str = host
+        # Nodes in the same cluster usually share a host, so intern the host
+        # and URI strings to dedupe them across nodes and make equality checks
+        # on them pointer comparisons
+        self._host: str = sys.intern(host)
         self._port: int = port
         self._password: str = password
         self._region: Optional[discord.VoiceRegion] = region
@@ -264,15 +384,43 @@ class Node:
         self._resumeKey: str = resumeKey
         self._spotifyClient: Optional[SpotifyClient] = spotifyClient
         self._identifier: str = identifier
-        self._players: List[Player] = []
+        self._players: Dict[int, Player] = {}
         self._stats: Optional[Stats] = None
-        self._session: aiohttp.ClientSession = aiohttp.ClientSession()
+        # The penalty is recomputed once per stats event rather than every
+        # time a load balancing selector walks the nodes
+        self._cachedPenalty: float = 0.0
+        # Exponentially weighted moving average of measured REST round-trip
+        # times, updated by _getData. Zero until the first sample lands
+        self._rttEwma: float = 0.0
+        self._session: Optional[aiohttp.ClientSession] = None
+        # The auth header never changes, so build it once instead of per call
+        # and wrap it read-only so nothing can mutate it between requests
+        self._authHeaders: Mapping[str, str] = MappingProxyType({"Authorization": password})
+        self._trackCache: OrderedDict[Tuple[str, str], Tuple[float, Dict[str, Any]]] = OrderedDict()
+        # Decoded info for a base64 track ID never changes (the ID encodes
+        # it), so decoded tracks are cached without a TTL, bounded by LRU
+        self._decodeCache: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        self._inflight: Dict[Tuple[str, str], asyncio.Task] = {}
+        self._sendBuffer: List[bytes] = []
+        self._flushTask: Optional[asyncio.Task] = None
         self._websocket: Optional[Websocket] = None
-        self._websocketUri: str = f"{'wss' if self._secure else 'ws'}://{self.host}:{self.port}"
-        self._restUri: str = f"{'https' if self._secure else 'http'}://{self.host}:{self.port}"
+        self._websocketUri: str = sys.intern(f"{'wss' if self._secure else 'ws'}://{self.host}:{self.port}")
+        self._restUri: str = sys.intern(f"{'https' if self._secure else 'http'}://{self.host}:{self.port}")
+        self._restUrl: URL = URL(self._restUri)
+        # The only two REST endpoints Lavapy talks to, joined once so request
+        # time skips the per-call URL parse and path join entirely
+        self._loadtracksUrl: URL = self._restUrl / "loadtracks"
+        self._decodetracksUrl: URL = self._restUrl / "decodetracks"
 
     def __repr__(self) -> str:
-        return f"<Lavapy Node (Domain={self.host}:{self.port}) (Identifier={self.identifier}) (Region={self.region}) (Players={len(self.players)})>"
+        return f"<Lavapy Node (Domain={self._host}:{self._port}) (Identifier={self._identifier}) (Region={self._region}) (Players={len(self._players)})>"
+
+    async def __aenter__(self) -> Node:
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.disconnect()
 
     @property
     def client(self) -> Union[discord.Client, discord.AutoShardedClient, discord.ext.commands.Bot, discord.ext.commands.AutoShardedBot]:
@@ -327,7 +475,7 @@ class Node:
     @property
     def players(self) -> List[Player]:
         """Returns a list of all Lavapy player objects which are connected to this node."""
-        return self._players
+        return list(self._players.values())
 
     @property
     def stats(self) -> Optional[Stats]:
@@ -335,7 +483,7 @@ class Node:
         return self._stats
 
     @property
-    def session(self) -> aiohttp.client.ClientSession:
+    def session(self) -> Optional[aiohttp.ClientSession]:
         """Returns the session used for sending and getting data."""
         return self._session
 
@@ -352,18 +500,16 @@ class Node:
     @property
     def penalty(self) -> float:
         """Returns the load balancing penalty for this node."""
-        if self.stats is None:
-            return 0.0
-        return self.stats.penalty.total
+        return self._cachedPenalty
 
     async def _initialiseExtensions(self) -> None:
         """|coro|
 
         Initialises all the extensions linked to this :class:`Node`.
         """
-        if self.spotifyClient is not None:
-            logger.debug(f"Initialising spotify extension for node {self.identifier}")
-            await self.spotifyClient._getBearerToken()
+        if self._spotifyClient is not None:
+            logger.debug("Initialising spotify extension for node %s", self._identifier)
+            await self._spotifyClient._getBearerToken()
 
     async def connect(self) -> None:
         """|coro|
@@ -375,9 +521,22 @@ class Node:
         WebsocketAlreadyExists
             The websocket for this node already exists.
         """
-        logger.debug(f"Connecting to the Lavalink server at {self.host}:{self.port}")
+        logger.debug("Connecting to the Lavalink server at %s:%s", self._host, self._port)
+        if self._session is None:
+            # Created here rather than in __init__ so the session binds to the
+            # running event loop. A long-running process only ever talks to one
+            # Lavalink host, so tune the connector for that: a generous
+            # keep-alive so the pool doesn't empty under low traffic (forcing
+            # a TCP/TLS re-handshake) and a long DNS cache since the host
+            # doesn't change
+            self._session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit_per_host=16, keepalive_timeout=75, ttl_dns_cache=300, enable_cleanup_closed=True))
         if self._websocket is None:
+            # Awaiting the handshake here (rather than letting the websocket
+            # fire off a background task in its constructor) means createNode
+            # returns a node whose connection attempt has actually finished,
+            # and connection errors surface to the caller's await
             self._websocket = Websocket(self)
+            await self._websocket.connect()
         else:
             await self._websocket.resumeConnection()
 
@@ -391,43 +550,63 @@ class Node:
         force: bool
             Whether to force the disconnection. This is currently not used.
         """
-        logger.debug(f"Disconnecting node {self.identifier}")
-        for player in self.players:
-            await player.disconnect(force=force)
+        logger.debug("Disconnecting node %s", self._identifier)
+        # Snapshot the players so disconnects mutating the list don't tear the
+        # iteration, then fan the round-trips out instead of serialising them
+        await asyncio.gather(*(player.disconnect(force=force) for player in list(self._players.values())), return_exceptions=True)
 
-        if self.spotifyClient:
-            await self.spotifyClient.close()
+        if self._spotifyClient:
+            await self._spotifyClient.close()
 
         try:
             await self._websocket.disconnect()
-            del NodePool._nodes[self.identifier]
+            del NodePool._nodes[self._identifier]
+            if self._region is not None:
+                regionNodes = NodePool._byRegion.get(self._region)
+                if regionNodes is not None and self in regionNodes:
+                    regionNodes.remove(self)
+            if self._spotifyClient is not None and self in NodePool._spotifyNodes:
+                NodePool._spotifyNodes.remove(self)
         except Exception as e:
-            logger.debug(f"Failed to remove node {self.identifier} with error {e}")
+            logger.debug("Failed to remove node %s with error %s", self._identifier, e)
+
+        if self._session is not None:
+            # Close the session explicitly so the connector flushes its
+            # sockets instead of leaking them with an unclosed client session
+            # warning
+            await self._session.close()
 
-    async def _getData(self, endpoint: str, params: Dict[str, str]) -> Tuple[Dict[str, Any], aiohttp.ClientResponse]:
+    async def _getData(self, url: URL, params: Dict[str, str]) -> Tuple[Dict[str, Any], int]:
         """|coro|
 
-        Make a request to Lavalink with a given endpoint and return a response.
+        Make a request to Lavalink with a given endpoint URL and return a response.
 
         Parameters
         ----------
-        endpoint: str
-            The endpoint to query from Lavalink.
+        url: URL
+            The pre-built endpoint URL to query from Lavalink.
         params: Dict[str, str]
             A dict containing additional info to send to Lavalink.
 
         Returns
         -------
-        Tuple[Dict[str, Any], :class:`aiohttp.ClientResponse`]
-            A tuple containing the response from Lavalink as well as the websocket response to determine the status of the request.
+        Tuple[Dict[str, Any], int]
+            A tuple containing the response from Lavalink as well as the status code to determine the status of the request.
         """
-        logger.debug(f"Getting endpoint {endpoint} with data {params}")
-        headers = {
-            "Authorization": self.password
-        }
-        async with await self.session.get(f"{self.restUri}/{endpoint}", headers=headers, params=params) as req:
-            data = await req.json()
-        return data, req
+        logger.debug("Getting endpoint %s with data %s", url, params)
+        start = time.monotonic()
+        # Reading the whole body inside the context manager (and keeping only
+        # the status code rather than the response object) lets aiohttp
+        # release the connection back to the pool immediately, keeping the
+        # socket warm for the next request
+        async with self._session.get(url, headers=self._authHeaders, params=params) as req:
+            body = await req.read()
+            status = req.status
+        rtt = time.monotonic() - start
+        # Each sample nudges the average a fifth of the way, so a slow node
+        # recovers quickly without one outlier request dominating selection
+        self._rttEwma = self._rttEwma * 0.8 + rtt * 0.2 if self._rttEwma else rtt
+        return _loads(body), status
 
     async def _send(self, payload: Dict[str, Any]) -> None:
         """|coro|
@@ -439,8 +618,60 @@ class Node:
         payload: Dict[str, Any]
             The payload to send to Lavalink.
         """
-        if self._websocket.connected:
-            await self._websocket.send(payload)
+        # Encoding at enqueue time means callers can safely mutate template
+        # payloads as soon as this returns
+        self._enqueueSend(_dumps(payload))
+
+    async def _sendRaw(self, data: bytes) -> None:
+        """|coro|
+
+        Send an already encoded payload to Lavalink without a response. This
+        skips re-serialising payloads whose bytes never change between sends.
+
+        Parameters
+        ----------
+        data: bytes
+            The encoded payload to send to Lavalink.
+        """
+        self._enqueueSend(data)
+
+    def _enqueueSend(self, data: bytes) -> None:
+        """
+        Buffers an encoded payload and schedules a flush. Back-to-back sends
+        in the same event loop tick (play followed by volume, for example) get
+        drained by a single task instead of each paying their own wakeup.
+
+        Parameters
+        ----------
+        data: bytes
+            The encoded payload to buffer.
+        """
+        self._sendBuffer.append(data)
+        if self._flushTask is None or self._flushTask.done():
+            self._flushTask = asyncio.create_task(self._flushSendBuffer())
+
+    async def _flushSendBuffer(self) -> None:
+        """|coro|
+
+        Drains the send buffer to the websocket in order. Payloads buffered
+        while the websocket is down are dropped, matching the old behaviour of
+        silently skipping sends on a disconnected socket.
+        """
+        while self._sendBuffer:
+            buffer = self._sendBuffer
+            self._sendBuffer = []
+            if not self._websocket.connected:
+                continue
+            for index, data in enumerate(buffer):
+                try:
+                    await self._websocket.sendRaw(data)
+                except Exception as e:
+                    # The socket can die between the connected check and the
+                    # write. Dropping the rest of this batch matches the
+                    # drop-on-disconnect behaviour above, and keeping the task
+                    # alive means later payloads still get flushed
+                    logger.warning("Dropping %d buffered payloads for node %s after send failure: %s", len(buffer) - index, self._identifier, e)
+                    break
 
     async def buildTrack(self, cls: Type[Track], id: str) -> Track:
         """|coro|
@@ -464,11 +695,140 @@ class Node:
         Track
             A Lavapy track object.
         """
-        logger.debug(f"Building track with cls {cls} and id {id}")
-        track, response = await self._getData("decodetrack", {"track": id})
-        if response.status != 200:
-            raise BuildTrackError("A error occurred while building the track.", track)
-        return cls(id, track)
+        logger.debug("Building track with cls %s and id %s", cls, id)
+        tracks = await self.buildTracks(cls, [id])
+        return tracks[0]
+
+    async def buildTracks(self, cls: Type[Track], ids: List[str]) -> List[Track]:
+        """|coro|
+
+        Builds multiple :class:`Track` objects from base64 track IDs in a single request.
+
+        This uses Lavalink's decodetracks endpoint which decodes a whole array
+        at once, so rebuilding a saved queue costs one round-trip instead of
+        one per track.
+
+        Parameters
+        ----------
+        cls: Type[Track]
+            The Lavapy resource to return instances of.
+        ids: List[str]
+            The base64 track IDs.
+
+        Raises
+        ------
+        BuildTrackError
+            An error occurred while building the tracks.
+
+        Returns
+        -------
+        List[Track]
+            A list of Lavapy track objects in the same order as the given IDs.
+        """
+        logger.debug("Building %d tracks with cls %s", len(ids), cls)
+        cache = self._decodeCache
+        infos: Dict[str, Dict[str, Any]] = {}
+        missing: List[str] = []
+        for id in ids:
+            info = cache.get(id)
+            if info is None:
+                missing.append(id)
+            else:
+                cache.move_to_end(id)
+                infos[id] = info
+        if missing:
+            async with self._session.post(self._decodetracksUrl, headers=self._authHeaders, json=missing) as req:
+                data = _loads(await req.read())
+                status = req.status
+            if status != 200:
+                raise BuildTrackError("A error occurred while building the tracks.", data)
+            # decodetracks returns an array of {"track": id, "info": {...}}
+            # wrappers, unlike decodetrack which returns the bare info dict
+            for id, element in zip(missing, data):
+                info = element["info"]
+                infos[id] = info
+                cache[id] = info
+                cache.move_to_end(id)
+            while len(cache) > _trackCacheSize:
+                cache.popitem(last=False)
+        return [cls(id, infos[id]) for id in ids]
+
+    def _getCachedTracks(self, cacheKey: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+        """
+        Gets a previously cached loadtracks response if it hasn't expired yet.
+
+        Parameters
+        ----------
+        cacheKey: Tuple[str, str]
+            The class name and query the response was cached under.
+
+        Returns
+        -------
+        Optional[Dict[str, Any]]
+            The cached response or None if there isn't a valid one.
+        """
+        cached = self._trackCache.get(cacheKey)
+        if cached is None:
+            return None
+        expiry, data = cached
+        if expiry <= time.monotonic():
+            del self._trackCache[cacheKey]
+            return None
+        self._trackCache.move_to_end(cacheKey)
+        return data
+
+    def _cacheTracks(self, cacheKey: Tuple[str, str], data: Dict[str, Any], ttl: float = _trackCacheTTL) -> None:
+        """
+        Caches a loadtracks response so identical queries skip the HTTP round-trip.
+
+        Parameters
+        ----------
+        cacheKey: Tuple[str, str]
+            The class name and query to cache the response under.
+        data: Dict[str, Any]
+            The response from Lavalink.
+        ttl: float
+            How many seconds the cached response stays valid for.
+        """
+        self._trackCache[cacheKey] = (time.monotonic() + ttl, data)
+        self._trackCache.move_to_end(cacheKey)
+        while len(self._trackCache) > _trackCacheSize:
+            self._trackCache.popitem(last=False)
+
+    def invalidateTrackCache(self) -> None:
+        """Clears all cached loadtracks responses for this :class:`Node`."""
+        self._trackCache.clear()
+
+    async def _fetchTracks(self, cacheKey: Tuple[str, str], query: str) -> Dict[str, Any]:
+        """|coro|
+
+        Queries Lavalink for a loadtracks response and caches successful results.
+
+        Parameters
+        ----------
+        cacheKey: Tuple[str, str]
+            The class name and query to cache the response under.
+        query: str
+            The query to search for via Lavalink.
+
+        Raises
+        ------
+        LavalinkException
+            Lavalink returned an invalid response.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The response from Lavalink.
+        """
+        data, status = await self._getData(self._loadtracksUrl, {"identifier": query})
+        if status != 200:
+            raise LavalinkException("Invalid response from lavalink.")
+        if data.get("loadType") in ("LOAD_FAILED", "NO_MATCHES"):
+            self._cacheTracks(cacheKey, data, ttl=_trackCacheFailureTTL)
+        else:
+            self._cacheTracks(cacheKey, data)
+        return data
 
     async def getTracks(self, cls: Type[Playable], query: str) -> Optional[Union[Track, List[Track], MultiTrack]]:
         """|coro|
@@ -487,24 +847,21 @@ class Node:
         Optional[Union[Track, List[Track], MultiTrack]]
             A Lavapy resource which can be used to play music.
         """
-        logger.info(f"Getting data with cls {cls} and query: {query}")
-        data, response = await self._getData("loadtracks", {"identifier": query})
-        if response.status != 200:
-            raise LavalinkException("Invalid response from lavalink.")
-
-        loadType = data.get("loadType")
-        if loadType == "LOAD_FAILED":
-            raise LoadTrackError(f"Track failed to load with data: {data}.")
-        elif loadType == "NO_MATCHES":
-            return None
-        elif loadType == "TRACK_LOADED":
-            trackInfo = data["tracks"][0]
-            # noinspection PyTypeChecker
-            return cls(trackInfo["track"], trackInfo["info"])
-        elif loadType == "SEARCH_RESULT":
-            # noinspection PyTypeChecker
-            return [cls(element["track"], element["info"]) for element in data["tracks"]]
-        elif loadType == "PLAYLIST_LOADED":
-            playlistInfo = data["playlistInfo"]
-            # noinspection PyTypeChecker
-            return cls(playlistInfo["name"], [cls._trackCls(track["track"], track["info"]) for track in data["tracks"]])
+        logger.info("Getting data with cls %s and query: %s", cls, query)
+        cacheKey = (cls.__name__, query)
+        data = self._getCachedTracks(cacheKey)
+        if data is None:
+            task = self._inflight.get(cacheKey)
+            if task is None:
+                # Coalesce concurrent identical queries into a single request
+                # so every caller awaits the same round-trip
+                task = asyncio.ensure_future(self._fetchTracks(cacheKey, query))
+                self._inflight[cacheKey] = task
+                task.add_done_callback(lambda _: self._inflight.pop(cacheKey, None))
+            # Shielded so one caller being cancelled (a timed-out command)
+            # doesn't cancel the shared request under everyone else
+            data = await asyncio.shield(task)
+
+        handler = _loadHandlers.get(data.get("loadType"))
+        if handler is not None:
+            return handler(cls, data)
@@ -100,6 +100,8 @@ class Playable:
     .. warning::
         This class should not be created manually. Instead use a subclass of :class:`Track` or :class:`MultiTrack`.
     """
+    __slots__ = ()
+
     _searchType: str
     _trackCls: Optional[Type[YoutubeMusicTrack]]
     _queryGetter: Callable = defaultQueryGetter
@@ -203,6 +205,17 @@ class Track:
     info: Dict[str, Any]
         The raw track info.
     """
+    __slots__ = ("_id",
+                 "_info",
+                 "_identifier",
+                 "_isSeekable",
+                 "_author",
+                 "_length",
+                 "_isStream",
+                 "_type",
+                 "_title",
+                 "_uri")
+
     def __init__(self, id: str, info: Dict[str, Any]) -> None:
         self._id: str = id
         self._info: Dict[str, Any] = info
@@ -218,6 +231,23 @@ class Track:
     def __repr__(self) -> str:
         return f"<Lavapy Track (Identifier={self.identifier}) (Type={self.type})>"
 
+    @classmethod
+    def fromDict(cls, data: Dict[str, Any]) -> Track:
+        """
+        Builds a :class:`Track` from a raw Lavalink track dict.
+
+        Parameters
+        ----------
+        data: Dict[str, Any]
+            A raw track dict containing a base64 track ID and an info dict.
+
+        Returns
+        -------
+        Track
+            A Lavapy track object.
+        """
+        return cls(data["track"], data["info"])
+
     @property
     def id(self) -> str:
         """Returns the base64 track ID."""
@@ -240,7 +270,7 @@ class Track:
 
     @property
     def length(self) -> int:
-        """Returns the duration of the track in seconds."""
+        """Returns the duration of the track in milliseconds."""
         return self._length
 
     @property
@@ -298,6 +328,8 @@ class MultiTrack:
 
 class YoutubeTrack(Track, Playable):
     """A track created using a search to Youtube."""
+    __slots__ = ()
+
     _searchType: str = "ytsearch"
 
     def __repr__(self) -> str:
@@ -311,6 +343,8 @@ class YoutubeTrack(Track, Playable):
 
 class YoutubeMusicTrack(Track, Playable):
     """A track created using a search to Youtube Music."""
+    __slots__ = ()
+
     _searchType: str = "ytmsearch"
 
     def __repr__(self) -> str:
@@ -319,6 +353,8 @@ class YoutubeMusicTrack(Track, Playable):
 
 class SoundcloudTrack(Track, Playable):
     """A track created using a search to Soundcloud."""
+    __slots__ = ()
+
     _searchType: str = "scsearch"
 
     def __repr__(self) -> str:
@@ -327,6 +363,7 @@ class SoundcloudTrack(Track, Playable):
 
 class LocalTrack(Track, Playable):
     """A track created using a search to a Discord mp3 file."""
+    __slots__ = ()
 
     def __repr__(self) -> str:
         return f"<Lavapy LocalTrack (Identifier={self.identifier})>"
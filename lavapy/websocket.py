@@ -29,6 +29,11 @@ from typing import TYPE_CHECKING, Any, Dict, Optional
 
 import aiohttp
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .backoff import ExponentialBackoff
 from .events import LavapyEvent, TrackEndEvent, TrackExceptionEvent, TrackStartEvent, TrackStuckEvent, WebsocketClosedEvent, WebsocketOpenEvent
 from .stats import Stats
@@ -56,7 +61,6 @@ class Websocket:
         self._node: Node = node
         self._connection: Optional[aiohttp.client.ClientWebSocketResponse] = None
         self._listener: Optional[asyncio.Task] = None
-        asyncio.create_task(self.connect())
 
     def __repr__(self) -> str:
         return f"<Lavapy Websocket (Domain={self.node.host}:{self.node.port}) (Connected={self.connected})>"
@@ -95,7 +99,7 @@ class Websocket:
         Player
             A Lavapy player object.
         """
-        return [player for player in self.node.players if player.guild.id == guildID][0]
+        return self.node._players[guildID]
 
     async def send(self, payload: Dict[str, Any]) -> None:
         """|coro|
@@ -108,7 +112,25 @@ class Websocket:
             The payload to send to Lavalink.
         """
         logger.debug(f"Sending payload {payload}")
-        await self.connection.send_json(payload)
+        if orjson is not None:
+            # orjson encodes straight to bytes, skipping both the stdlib json
+            # walker and aiohttp's internal str to bytes hop
+            await self.connection.send_bytes(orjson.dumps(payload))
+        else:
+            await self.connection.send_json(payload)
+
+    async def sendRaw(self, data: bytes) -> None:
+        """|coro|
+
+        Sends an already encoded payload to Lavalink without a response.
+
+        Parameters
+        ----------
+        data: bytes
+            The encoded payload to send to Lavalink.
+        """
+        logger.debug("Sending raw payload of %d bytes", len(data))
+        await self.connection.send_bytes(data)
 
     async def connect(self) -> None:
         """|coro|
@@ -134,7 +156,9 @@ class Websocket:
                 logger.error(f"Authorisation failed for node {self.node.identifier}")
             else:
                 logger.error(f"Connection failure for node {self.node.identifier} with error {error}")
-            return
+            # Propagate so the awaiting caller (createNode via Node.connect)
+            # fails fast instead of receiving a node with no connection
+            raise
         self._listener = self.node.client.loop.create_task(self.createListener())
         logger.debug(f"Connection established for node {self.node.identifier}")
         event = WebsocketOpenEvent(self.node)
@@ -197,14 +221,17 @@ class Websocket:
             try:
                 player = self.getPlayer(int(data["guildId"]))
                 player._updateState(data)
-            except IndexError:
+            except KeyError:
                 # Player has recently sent a destroy op so don't update state
                 pass
         elif op == "event":
             event = await self.getEventPayload(data["type"], data)
             await self.dispatchEvent(f"lavapy_{event.event}", event.payload)
         elif op == "stats":
-            self.node._stats = Stats(self.node, data)
+            stats = Stats(self.node, data)
+            self.node._stats = stats
+            # Recompute the cached load balancing penalty once per stats event
+            self.node._cachedPenalty = stats.penalty.total
 
     async def getEventPayload(self, name: str, data: Dict[str, Any]) -> LavapyEvent:
         """|coro|